@@ -10,22 +10,90 @@ Features added:
  - Input validation and robust flow
 
 Save file as: survive_or_die_story_en_ar.py
-Run: python3 survive_or_die_story_en_ar.py
+Run: python3 survive_or_die_story_en_ar.py  (Python 3.10+; add --fast or SOD_FAST=1 for instant text)
 """
 
 import sys
 import time
+import atexit
+import functools
 import random
 import os
-import json
-from datetime import datetime
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import select
+    import termios
+
+# Optional color support for Windows (enables VT escapes without wrapping stdout)
+if os.name == "nt":
+    try:
+        import colorama
+    except Exception:
+        colorama = None
+    if colorama is not None:
+        if hasattr(colorama, "just_fix_windows_console"):  # colorama >= 0.4.6
+            colorama.just_fix_windows_console()
+        else:
+            colorama.init()
+
+# Checkpoint encoding: compact MessagePack when installed, otherwise JSON
+# (orjson if available, else stdlib json). Resolved on first save/load only,
+# so startup doesn't pay for the imports.
+
+@functools.cache
+def _json_codec():
+    """(dumps, loads) pair for JSON checkpoints."""
+    try:
+        import orjson
+        return orjson.dumps, orjson.loads
+    except ImportError:
+        import json
+
+        def dumps(obj):
+            return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+        return dumps, json.loads
+
+
+@functools.cache
+def _msgpack():
+    """The msgpack module, or None when it isn't installed."""
+    try:
+        import msgpack
+        return msgpack
+    except ImportError:
+        return None
+
+
+def _dumps(obj):
+    msgpack = _msgpack()
+    if msgpack is None:
+        return _json_codec()[0](obj)
+    return msgpack.packb(obj, use_bin_type=True)
 
-# Optional color support for Windows
-try:
-    import colorama
-    colorama.init()
-except Exception:
-    pass
+
+def _loads(data):
+    # JSON checkpoints (written without msgpack) always start with "{"
+    if data[:1] == b"{":
+        return _json_codec()[1](data)
+    msgpack = _msgpack()
+    if msgpack is None:
+        raise ValueError("checkpoint is MessagePack but msgpack is not installed")
+    return msgpack.unpackb(data, raw=False)
+
+# Ask Windows for 1 ms timer resolution so short sleeps aren't rounded up to ~15 ms
+if os.name == "nt":
+    try:
+        import ctypes
+        _winmm = ctypes.WinDLL("winmm")
+        _winmm.timeBeginPeriod(1)
+        atexit.register(_winmm.timeEndPeriod, 1)
+    except Exception:
+        pass
 
 # ----------------- Terminal Colors -----------------
 RESET = "\033[0m"
@@ -44,124 +112,442 @@ BG_RED = "\033[41m"
 BG_GREEN = "\033[42m"
 BG_YELLOW = "\033[43m"
 
+CLEAR_SCREEN = "\033[2J\033[H"
+
+# Color styles as pre-built (prefix, suffix) pairs: type_text(msg, style="green")
+_C = {
+    "red": (FG_RED, RESET),
+    "green": (FG_GREEN, RESET),
+    "yellow": (FG_YELLOW, RESET),
+    "magenta": (FG_MAGENTA, RESET),
+    "cyan": (FG_CYAN, RESET),
+    "title": (FG_CYAN + BOLD, RESET),
+}
+
+
+def paint(style, text):
+    """`text` wrapped in a style's color codes, for plain print()/prompts."""
+    prefix, suffix = _C[style]
+    return prefix + text + suffix
+
 # ----------------- Settings -----------------
 TYPE_DELAY = 0.018
 FAST_DELAY = 0.005
-SAVE_FILENAME = "sod_checkpoint.json"
+SAVE_FILENAME = "sod_checkpoint.sav"  # MessagePack, or JSON without msgpack
+LEGACY_SAVE_FILENAME = "sod_checkpoint.json"  # older JSON checkpoints, still loadable
 RESULTS_FILENAME = "sod_results.txt"
+TYPE_CHUNK = 6  # characters written per typewriter tick
 
-# --------------- Utility Functions ----------------
+# SOD_FAST=1 or --fast disables all text animation (handy for replays and scripted runs)
+FAST = os.environ.get("SOD_FAST") == "1" or "--fast" in sys.argv[1:]
+if FAST:
+    TYPE_DELAY = FAST_DELAY = 0
 
-def type_text(text, delay=TYPE_DELAY, newline=True, color=None):
-    """Typewriter effect with optional color."""
-    if color:
-        sys.stdout.write(color)
-    for ch in text:
-        sys.stdout.write(ch)
-        sys.stdout.flush()
-        time.sleep(delay)
-    if color:
-        sys.stdout.write(RESET)
-    if newline:
-        sys.stdout.write("\n")
-    sys.stdout.flush()
+# SOD_PROMPT_TIMEOUT=<seconds> makes y/n prompts fall back to their default answer
+try:
+    PROMPT_TIMEOUT = float(os.environ["SOD_PROMPT_TIMEOUT"])
+except (KeyError, ValueError):
+    PROMPT_TIMEOUT = None
+
+# ----------------- Messages -----------------
+# All bilingual text, keyed by language then message id.
+MSGS = {
+    "en": {
+        "press_enter": "(press Enter to continue)",
+        "choose_1_3": "Choose 1-3: ",
+        "invalid_option": "Please choose a valid option.",
+        "invalid_number": "Please enter a valid number.",
+
+        "load_prompt": "Load previous checkpoint? (y/n)",
+        "loaded": "Loaded checkpoint for {name}.",
+        "load_failed": "Failed to load checkpoint.",
+        "name_prompt": "Enter player name: ",
+        "default_name": "Player",
+        "save_prompt": "Do you want to save a checkpoint now? (y/n)",
+        "saved": "Checkpoint saved.",
+        "save_failed": "Failed to save.",
+        "game_over": "You have lost all HP. Game Over.",
+        "retry_prompt": "Load checkpoint and retry? (y/n)",
+        "resumed": "Checkpoint loaded. Resuming...",
+        "no_checkpoint": "No checkpoint available. Exiting.",
+
+        "welcome": "\nWelcome, {name} — Story Mode.",
+        "choose_char": "Choose your character:",
+        "char_opt1": "1) Trickster — +luck",
+        "char_opt2": "2) Warrior — +force",
+        "char_opt3": "3) Scholar — +intellect",
+        "you_are": "You are: {char}. Good luck!",
+
+        "town_loader": "Arriving at the abandoned town...",
+        "town_scene": "\nScene: Abandoned town...",
+        "town_opt1": "1) Approach the occupied-looking house",
+        "town_opt2": "2) Enter the abandoned house",
+        "town_opt3": "3) Walk past quickly",
+        "town_win1": "You negotiated and got supplies. +10 pts",
+        "town_lose1": "Fight broke out. -1 HP",
+        "town_win2": "You found medical supplies. +5 pts",
+        "town_lose2": "A trap! -1 HP",
+        "town_win3": "You avoided danger. +1 pt",
+
+        "desert_loader": "Crossing the scorching desert...",
+        "desert_scene": "\nScene: Endless sands and a distant oasis...",
+        "desert_opt1": "1) Search for an oasis",
+        "desert_opt2": "2) Follow vehicle tracks",
+        "desert_opt3": "3) Conserve and manage inventory",
+        "desert_win1": "You reached an oasis. +8 pts",
+        "desert_lose1": "Heatstroke costs you. -1 HP",
+        "desert_win2": "You found a broken convoy with supplies. +10 pts",
+        "desert_lose2": "You got lost. -1 HP",
+        "desert_win3": "You conserved resources. +2 pts",
+
+        "lab_loader": "Infiltrating an abandoned lab...",
+        "lab_scene": "\nScene: Lab with equipment and vials...",
+        "lab_opt1": "1) Inspect equipment",
+        "lab_opt2": "2) Take a sample carefully",
+        "lab_opt3": "3) Steal gear and leave",
+        "lab_win1": "You repurposed machinery. +12 pts",
+        "lab_lose1": "Alarm! -1 HP",
+        "lab_win2": "Valuable sample acquired. +15 pts",
+        "lab_lose2": "Sample spoiled. -1 HP",
+        "lab_win3": "You stole useful gear. +6 pts",
+        "lab_lose3": "Caught by scavengers. -1 HP",
+
+        "forest_loader": "Moving through a dense forest...",
+        "forest_scene": "\nScene: Trees and unknown noises...",
+        "forest_opt1": "1) Follow the sound of water",
+        "forest_opt2": "2) Avoid the noise",
+        "forest_opt3": "3) Set traps for animals",
+        "forest_win1": "Found a stream. +9 pts",
+        "forest_lose1": "Ambushed by bandits. -1 HP",
+        "forest_win2": "You avoided conflict. +3 pts",
+        "forest_win3": "Trap successful. +11 pts",
+        "forest_lose3": "Trap failed. -1 HP",
+
+        "boss_loader": "Approaching the stronghold...",
+        "boss_scene": "\nFinal Scene: The gang controls the water supply.",
+        "boss_opt1": "1) Direct assault",
+        "boss_opt2": "2) Negotiate/deceive",
+        "boss_opt3": "3) Make a deal/ally",
+        "boss_act1": "\nExecuting assault...",
+        "boss_act2": "\nAttempting negotiation...",
+        "boss_act3": "\nForming an alliance...",
+
+        "end_victory_force": "You led a victorious assault and liberated the stronghold!",
+        "end_victory_cunning": "Through cunning you secured control and rebalanced resources.",
+        "end_victory_alliance": "A risky alliance paid off — stable resources for many.",
+        "end_compromise": "You compromised — survival with strings attached.",
+        "end_betrayed": "You were betrayed. Learn and adapt.",
+        "end_defeat": "Defeat — you survived barely or perished.",
+        "results_prompt": "Do you want to save this run to results file? (y/n)",
+        "results_saved": "Saved to file.",
+    },
+    "ar": {
+        "press_enter": " Enter ...",
+        "choose_1_3": " 1-3: ",
+        "invalid_option": "   .",
+        "invalid_number": "   .",
+
+        "load_prompt": "     (y/n)",
+        "loaded": "   {name}.",
+        "load_failed": "  .",
+        "name_prompt": "  : ",
+        "default_name": "",
+        "save_prompt": "     (y/n)",
+        "saved": "  .",
+        "save_failed": " .",
+        "game_over": " .  .",
+        "retry_prompt": "     (y/n)",
+        "resumed": "  .  ...",
+        "no_checkpoint": "   . .",
+
+        "welcome": "\n {name} –   .",
+        "choose_char": " :",
+        "char_opt1": "1)  — +",
+        "char_opt2": "2)  — +",
+        "char_opt3": "3)  — +",
+        "you_are": ": {char}.  !",
+
+        "town_loader": "   ...",
+        "town_scene": "\n:  ...",
+        "town_opt1": "1)    ",
+        "town_opt2": "2)   ",
+        "town_opt3": "3)   ",
+        "town_win1": "  ! +10 ",
+        "town_lose1": "   .",
+        "town_win2": "  . +5 ",
+        "town_lose2": "!  .",
+        "town_win3": " . +1 ",
+
+        "desert_loader": "  ...",
+        "desert_scene": "\n:      ...",
+        "desert_opt1": "1)   ",
+        "desert_opt2": "2)   ",
+        "desert_opt3": "3)   ",
+        "desert_win1": " . +8 ",
+        "desert_lose1": "  .  .",
+        "desert_win2": "   . +10 ",
+        "desert_lose2": "  .  .",
+        "desert_win3": " . +2 ",
+
+        "lab_loader": "  ...",
+        "lab_scene": "\n:     ...",
+        "lab_opt1": "1)  ",
+        "lab_opt2": "2)   ",
+        "lab_opt3": "3)   ",
+        "lab_win1": "  . +12 ",
+        "lab_lose1": " .  .",
+        "lab_win2": "   . +15 ",
+        "lab_lose2": " .  .",
+        "lab_win3": "  . +6 ",
+        "lab_lose3": "  .  .",
+
+        "forest_loader": "   ...",
+        "forest_scene": "\n:    ...",
+        "forest_opt1": "1)   ",
+        "forest_opt2": "2)   ",
+        "forest_opt3": "3)   ",
+        "forest_win1": "  . +9 ",
+        "forest_lose1": "!  .",
+        "forest_win2": " . +3 ",
+        "forest_win3": " . +11 ",
+        "forest_lose3": " .  .",
+
+        "boss_loader": "   ...",
+        "boss_scene": "\n :      .",
+        "boss_opt1": "1)  ",
+        "boss_opt2": "2) /",
+        "boss_opt3": "3)  ",
+        "boss_act1": " ...",
+        "boss_act2": " ...",
+        "boss_act3": " ...",
+
+        "end_victory_force": "    !",
+        "end_victory_cunning": "       .",
+        "end_victory_alliance": "      .",
+        "end_compromise": "  —   .",
+        "end_betrayed": " .  .",
+        "end_defeat": " —     .",
+        "results_prompt": "    (y/n)",
+        "results_saved": " .",
+    },
+}
+
+# Character names per language, in menu order
+CHARS = {
+    "en": ("Trickster", "Warrior", "Scholar"),
+    "ar": ("", "", ""),
+}
 
+# --------------- Utility Functions ----------------
 
-def loading_bar(text="Loading", steps=20, speed=0.03, color=None):
-    if color:
-        type_text(text, color=color)
-    else:
-        type_text(text)
-    for i in range(steps):
-        bar = "[" + "#" * (i+1) + "-" * (steps-i-1) + "]"
-        sys.stdout.write(bar + "\r")
-        sys.stdout.flush()
-        time.sleep(speed)
+def _wait_until(deadline):
+    """Sleep until perf_counter() reaches `deadline`, spinning for the last 1 ms.
+
+    Keeps short typewriter delays accurate on coarse OS timers.
+    """
+    now = time.perf_counter
+    remaining = deadline - now()
+    if remaining > 0.001:
+        time.sleep(remaining - 0.001)
+    while now() < deadline:
+        pass
+
+
+def type_text(text, delay=TYPE_DELAY, newline=True, style=None):
+    """Typewriter effect, written a few chars at a time.
+
+    `style` names a _C color; its codes are written around the text unpaced.
+    """
+    prefix, suffix = _C[style] if style else ("", "")
+    if FAST or delay <= 0:
+        print(prefix + text + suffix, end="\n" if newline else "", flush=True)
+        return
+    # Locals avoid global/attribute lookups inside the loop
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    wait = _wait_until
+    chunk = TYPE_CHUNK
+    step = delay * chunk
+    write(prefix)
+    deadline = time.perf_counter()
+    for i in range(0, len(text), chunk):
+        write(text[i:i + chunk])
+        flush()
+        deadline += step
+        wait(deadline)
+    write(suffix)
+    if newline:
+        write("\n")
+    flush()
+
+
+@functools.lru_cache(maxsize=8)
+def _bar_frames(steps):
+    """Pre-rendered progress bar frames (each ends with a carriage return)."""
+    return tuple("[" + "#" * (i+1) + "-" * (steps-i-1) + "]\r" for i in range(steps))
+
+
+def loading_bar(text="Loading", steps=20, speed=0.03, style=None):
+    type_text(text, style=style)
+    frames = _bar_frames(steps)
+    if FAST:
+        print(frames[-1].rstrip("\r"))
+        return
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    sleep = time.sleep
+    for frame in frames:
+        write(frame)
+        flush()
+        sleep(speed)
     print()
 
 
 def clear():
-    os.system("cls" if os.name == "nt" else "clear")
+    if os.environ.get("TERM") == "dumb":
+        os.system("cls" if os.name == "nt" else "clear")
+        return
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
 
 
-def ask_int(prompt, valid=None, lang="en"):
-    """Ask for integer with optional set of valid answers."""
+def ask_choice(prompt, valid, lang="en"):
+    """Ask until the answer is one of the `valid` strings, e.g. {"1", "2", "3"}.
+
+    Other decimal forms ("01", Arabic-Indic "٢") are normalised to ASCII.
+    """
     while True:
-        try:
-            val = input(prompt).strip()
-            num = int(val)
-            if valid and num not in valid:
-                if lang == "ar":
-                    type_text("   .", FAST_DELAY, color=FG_YELLOW)
-                else:
-                    type_text("Please choose a valid option.", FAST_DELAY, color=FG_YELLOW)
-                continue
-            return num
-        except ValueError:
-            if lang == "ar":
-                type_text("   .", FAST_DELAY, color=FG_YELLOW)
-            else:
-                type_text("Please enter a valid number.", FAST_DELAY, color=FG_YELLOW)
+        val = input(prompt).strip()
+        if val in valid:
+            return val
+        if val.isdecimal():
+            val = str(int(val))
+            if val in valid:
+                return val
+        _warn_invalid(val, lang)
+
+
+def _warn_invalid(val, lang):
+    key = "invalid_option" if val.isdecimal() else "invalid_number"
+    type_text(MSGS[lang][key], FAST_DELAY, style="yellow")
+
+
+def _drain_stdin():
+    """Discard keystrokes typed before a prompt was shown (terminals only)."""
+    if not sys.stdin.isatty():
+        return
+    try:
+        if os.name == "nt":
+            while msvcrt.kbhit():
+                msvcrt.getwch()
+        else:
+            termios.tcflush(sys.stdin, termios.TCIFLUSH)
+    except Exception:
+        pass
+
+
+def _stdin_ready(timeout):
+    """Wait up to `timeout` seconds for input; True if something can be read.
+
+    Piped input counts as always ready: lines may already sit in sys.stdin's
+    buffer, where select()/kbhit() can't see them.
+    """
+    if not sys.stdin.isatty():
+        return True
+    if os.name == "nt":
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                return True
+            time.sleep(0.01)
+        return False
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    return bool(ready)
+
+
+def _prompt_yn(prompt, default=False, timeout=PROMPT_TIMEOUT):
+    """Ask a y/n question; returns `default` on empty input, EOF or timeout.
+
+    Prompts are UI chrome, so they are printed at once (no typewriter effect).
+    """
+    _drain_stdin()
+    sys.stdout.write(prompt + "\n> ")
+    sys.stdout.flush()
+    if timeout is not None and not _stdin_ready(timeout):
+        return default
+    try:
+        ans = input().strip().lower()
+    except EOFError:
+        return default
+    if not ans:
+        return default
+    return ans.startswith("y")
 
 
 # ----------------- Player -----------------
+@dataclass(slots=True)
 class Player:
-    def __init__(self, name, lang="en"):
-        self.name = name
-        self.hp = 3
-        self.score = 0
-        self.char = None
-        self.inventory = []
-        self.lang = lang
-        self.stage = 0  # track progress for save/load
+    name: str
+    hp: int = 3
+    score: int = 0
+    char: Optional[str] = None
+    inventory: set = field(default_factory=set)
+    lang: str = "en"
+    stage: int = 0  # track progress for save/load
 
     def to_dict(self):
-        return {
-            "name": self.name,
-            "hp": self.hp,
-            "score": self.score,
-            "char": self.char,
-            "inventory": self.inventory,
-            "lang": self.lang,
-            "stage": self.stage,
-        }
+        d = asdict(self)
+        d["inventory"] = sorted(self.inventory)
+        return d
 
     @classmethod
     def from_dict(cls, d):
-        p = cls(d.get("name", "player"), d.get("lang", "en"))
-        p.hp = d.get("hp", 3)
-        p.score = d.get("score", 0)
-        p.char = d.get("char")
-        p.inventory = d.get("inventory", [])
-        p.stage = d.get("stage", 0)
-        return p
+        kwargs = {k: v for k, v in d.items() if k in cls.__dataclass_fields__}
+        kwargs.setdefault("name", "player")
+        kwargs["inventory"] = set(kwargs.get("inventory", ()))
+        return cls(**kwargs)
 
 # ----------------- Save / Load -----------------
 
 def save_checkpoint(player):
     try:
-        with open(SAVE_FILENAME, "w", encoding="utf-8") as f:
-            json.dump(player.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(SAVE_FILENAME, "wb") as f:
+            f.write(_dumps(player.to_dict()))
         return True
     except Exception as e:
         return False
 
 
 def load_checkpoint():
-    try:
-        if not os.path.exists(SAVE_FILENAME):
+    for filename in (SAVE_FILENAME, LEGACY_SAVE_FILENAME):
+        try:
+            with open(filename, "rb") as f:
+                return Player.from_dict(_loads(f.read()))
+        except FileNotFoundError:
+            continue
+        except Exception:
             return None
-        with open(SAVE_FILENAME, "r", encoding="utf-8") as f:
-            d = json.load(f)
-        return Player.from_dict(d)
-    except Exception:
-        return None
+    return None
+
+
+_RESULTS_FH = None
+
+
+def _results_fh():
+    """Results file handle, opened once and kept for the whole session."""
+    global _RESULTS_FH
+    if _RESULTS_FH is None:
+        _RESULTS_FH = open(RESULTS_FILENAME, "a", encoding="utf-8", buffering=8192)
+        atexit.register(_RESULTS_FH.close)
+    return _RESULTS_FH
 
 
 def append_result(player, tag, final_score):
     try:
-        with open(RESULTS_FILENAME, "a", encoding="utf-8") as f:
-            f.write(f"{datetime.utcnow().isoformat()} | {player.name} | {player.char} | {tag} | Score:{int(final_score)} | HP:{player.hp}\n")
+        f = _results_fh()
+        ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        f.write(f"{ts} | {player.name} | {player.char} | {tag} | Score:{int(final_score)} | HP:{player.hp}\n")
+        f.flush()
         return True
     except Exception:
         return False
@@ -169,245 +555,146 @@ def append_result(player, tag, final_score):
 # ----------------- Scenes / Levels -----------------
 
 def intro(player):
+    M = MSGS[player.lang]
     clear()
-    type_text(BOLD + "=== SURVIVE OR DIE: STORY MODE ===" + RESET, color=FG_CYAN)
-    if player.lang == "ar":
-        type_text(f"\n {player.name} –   .", color=FG_CYAN)
-        type_text(" :")
-        type_text("1)  — +")
-        type_text("2)  — +")
-        type_text("3)  — +")
-        ch = ask_int(" 1-3: ", valid={1,2,3}, lang="ar")
-        player.char = {1: "", 2: "", 3: ""}[ch]
-        type_text(f": {player.char}.  !", color=FG_GREEN)
-    else:
-        type_text(f"\nWelcome, {player.name} — Story Mode.", color=FG_CYAN)
-        type_text("Choose your character:")
-        type_text("1) Trickster — +luck")
-        type_text("2) Warrior — +force")
-        type_text("3) Scholar — +intellect")
-        ch = ask_int("Choose 1-3: ", valid={1,2,3}, lang="en")
-        player.char = {1: "Trickster", 2: "Warrior", 3: "Scholar"}[ch]
-        type_text(f"You are: {player.char}. Good luck!", color=FG_GREEN)
-    type_text("(press Enter to continue)" if player.lang=="en" else " Enter ...")
+    type_text("=== SURVIVE OR DIE: STORY MODE ===", style="title")
+    type_text(M["welcome"].format(name=player.name), style="cyan")
+    type_text(M["choose_char"])
+    type_text(M["char_opt1"])
+    type_text(M["char_opt2"])
+    type_text(M["char_opt3"])
+    ch = ask_choice(M["choose_1_3"], {"1", "2", "3"}, lang=player.lang)
+    player.char = CHARS[player.lang][int(ch) - 1]
+    type_text(M["you_are"].format(char=player.char), style="green")
+    type_text(M["press_enter"])
     input()
 
 
-# Level 1: Town (reuse earlier logic but bilingual)
-def level_town(player):
-    player.stage = max(player.stage, 1)
-    clear()
-    loading_bar("Arriving at the abandoned town..." if player.lang=="en" else "   ...", color=FG_MAGENTA)
-    if player.lang == "ar":
-        type_text("\n:  ...")
-        type_text("1)    ")
-        type_text("2)   ")
-        type_text("3)   ")
-        choice = ask_int(" 1-3: ", valid={1,2,3}, lang="ar")
-    else:
-        type_text("\nScene: Abandoned town...")
-        type_text("1) Approach the occupied-looking house")
-        type_text("2) Enter the abandoned house")
-        type_text("3) Walk past quickly")
-        choice = ask_int("Choose 1-3: ", valid={1,2,3}, lang="en")
-
-    luck = random.random()
-    if player.char in ("Trickster", ""):
-        luck += 0.15
-    elif player.char in ("Warrior", ""):
-        luck += 0.05
-    else:
-        luck += 0.08
-
-    if choice == 1:
-        if luck > 0.5 or player.char in ("Scholar", ""):
-            player.score += 10
-            player.inventory.append("Canned Food")
-            type_text("You negotiated and got supplies. +10 pts" if player.lang=="en" else "  ! +10 ", color=FG_GREEN)
+def scene_choice(player, scene):
+    """Show a scene's description and options, return the chosen option."""
+    M = MSGS[player.lang]
+    type_text(M[scene + "_scene"])
+    type_text(M[scene + "_opt1"])
+    type_text(M[scene + "_opt2"])
+    type_text(M[scene + "_opt3"])
+    return ask_choice(M["choose_1_3"], {"1", "2", "3"}, lang=player.lang)
+
+
+# Levels 1-4 are data: how luck is modified, and per option (1-3) the roll
+# threshold to beat, the reward on success and which characters always succeed.
+# A threshold of None means the option is safe (always rewarded, shown in yellow).
+# Failing a roll always costs 1 HP.
+LEVELS = [
+    {  # Level 1: Town
+        "name": "town", "stage": 1, "color": "magenta",
+        "char_bonus": ((("Trickster", ""), 0.15), (("Warrior", ""), 0.05)),
+        "default_char_bonus": 0.08,
+        "choices": (
+            {"thresh": 0.5, "score": 10, "item": "Canned Food", "auto_win": ("Scholar", "")},
+            {"thresh": 0.45, "score": 5, "item": "Medkit"},
+            {"thresh": None, "score": 1},
+        ),
+    },
+    {  # Level 2: Desert
+        "name": "desert", "stage": 2, "color": "yellow",
+        "item_bonus": ("Canned Food", 0.1),
+        "choices": (
+            {"thresh": 0.5, "score": 8, "item": "Oasis Water"},
+            {"thresh": 0.6, "score": 10, "item": "Spare Parts"},
+            {"thresh": None, "score": 2},
+        ),
+    },
+    {  # Level 3: Laboratory
+        "name": "lab", "stage": 3, "color": "cyan",
+        "item_bonus": ("Medkit", 0.08),
+        "choices": (
+            {"thresh": 0.55, "score": 12, "item": "Energy Cell"},
+            {"thresh": 0.5, "score": 15, "item": "Vaccine Sample"},
+            {"thresh": 0.4, "score": 6, "item": "Toolkit"},
+        ),
+    },
+    {  # Level 4: Forest
+        "name": "forest", "stage": 4, "color": "green",
+        "item_bonus": ("Oasis Water", 0.07),
+        "choices": (
+            {"thresh": 0.5, "score": 9, "item": "Fresh Water"},
+            {"thresh": None, "score": 3},
+            {"thresh": 0.55, "score": 11, "item": "Game Meat"},
+        ),
+    },
+]
+
+
+def luck_bonus(player, spec):
+    """Character/inventory modifier added to a level's luck roll."""
+    bonus = 0.0
+    if "char_bonus" in spec:
+        for chars, value in spec["char_bonus"]:
+            if player.char in chars:
+                bonus += value
+                break
         else:
-            player.hp -= 1
-            type_text("Fight broke out. -1 HP" if player.lang=="en" else "   .", color=FG_RED)
-    elif choice == 2:
-        if luck > 0.45:
-            player.score += 5
-            player.inventory.append("Medkit")
-            type_text("You found medical supplies. +5 pts" if player.lang=="en" else "  . +5 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("A trap! -1 HP" if player.lang=="en" else "!  .", color=FG_RED)
-    else:
-        player.score += 1
-        type_text("You avoided danger. +1 pt" if player.lang=="en" else " . +1 ", color=FG_YELLOW)
+            bonus += spec["default_char_bonus"]
+    item = spec.get("item_bonus")
+    if item and item[0] in player.inventory:
+        bonus += item[1]
+    return bonus
 
-    summary(player)
 
-# Level 2: Desert
-
-def level_desert(player):
-    player.stage = max(player.stage, 2)
+def run_level(player, spec):
+    M = MSGS[player.lang]
+    name = spec["name"]
+    player.stage = max(player.stage, spec["stage"])
     clear()
-    loading_bar("Crossing the scorching desert..." if player.lang=="en" else "  ...", color=FG_YELLOW)
-    if player.lang == "ar":
-        type_text("\n:      ...")
-        type_text("1)   ")
-        type_text("2)   ")
-        type_text("3)   ")
-        choice = ask_int(" 1-3: ", valid={1,2,3}, lang="ar")
-    else:
-        type_text("\nScene: Endless sands and a distant oasis...")
-        type_text("1) Search for an oasis")
-        type_text("2) Follow vehicle tracks")
-        type_text("3) Conserve and manage inventory")
-        choice = ask_int("Choose 1-3: ", valid={1,2,3}, lang="en")
-
-    luck = random.random()
-    if "Canned Food" in player.inventory:
-        luck += 0.1
-
-    if choice == 1:
-        if luck > 0.5:
-            player.score += 8
-            player.inventory.append("Oasis Water")
-            type_text("You reached an oasis. +8 pts" if player.lang=="en" else " . +8 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("Heatstroke costs you. -1 HP" if player.lang=="en" else "  .  .", color=FG_RED)
-    elif choice == 2:
-        if luck > 0.6:
-            player.score += 10
-            player.inventory.append("Spare Parts")
-            type_text("You found a broken convoy with supplies. +10 pts" if player.lang=="en" else "   . +10 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("You got lost. -1 HP" if player.lang=="en" else "  .  .", color=FG_RED)
+    loading_bar(M[name + "_loader"], style=spec["color"])
+    choice = scene_choice(player, name)
+
+    opt = spec["choices"][int(choice) - 1]
+    luck = random.random() + luck_bonus(player, spec)
+    if opt["thresh"] is None:
+        player.score += opt["score"]
+        type_text(M[f"{name}_win{choice}"], style="yellow")
+    elif luck > opt["thresh"] or player.char in opt.get("auto_win", ()):
+        player.score += opt["score"]
+        player.inventory.add(opt["item"])
+        type_text(M[f"{name}_win{choice}"], style="green")
     else:
-        player.score += 2
-        type_text("You conserved resources. +2 pts" if player.lang=="en" else " . +2 ", color=FG_YELLOW)
+        player.hp -= 1
+        type_text(M[f"{name}_lose{choice}"], style="red")
 
     summary(player)
 
-# Level 3: Laboratory
+# Final Boss Stage
 
-def level_lab(player):
-    player.stage = max(player.stage, 3)
-    clear()
-    loading_bar("Infiltrating an abandoned lab..." if player.lang=="en" else "  ...", color=FG_CYAN)
-    if player.lang == "ar":
-        type_text("\n:     ...")
-        type_text("1)  ")
-        type_text("2)   ")
-        type_text("3)   ")
-        choice = ask_int(" 1-3: ", valid={1,2,3}, lang="ar")
+def boss_char_mod(char, choice):
+    """Character modifier for the boss roll."""
+    if char in ("Warrior", ""):
+        return 0.25 if choice == "1" else 0.05
+    elif char in ("Scholar", ""):
+        return 0.25 if choice == "2" else 0.05
     else:
-        type_text("\nScene: Lab with equipment and vials...")
-        type_text("1) Inspect equipment")
-        type_text("2) Take a sample carefully")
-        type_text("3) Steal gear and leave")
-        choice = ask_int("Choose 1-3: ", valid={1,2,3}, lang="en")
-
-    luck = random.random()
-    if "Medkit" in player.inventory:
-        luck += 0.08
-
-    if choice == 1:
-        if luck > 0.55:
-            player.score += 12
-            player.inventory.append("Energy Cell")
-            type_text("You repurposed machinery. +12 pts" if player.lang=="en" else "  . +12 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("Alarm! -1 HP" if player.lang=="en" else " .  .", color=FG_RED)
-    elif choice == 2:
-        if luck > 0.5:
-            player.score += 15
-            player.inventory.append("Vaccine Sample")
-            type_text("Valuable sample acquired. +15 pts" if player.lang=="en" else "   . +15 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("Sample spoiled. -1 HP" if player.lang=="en" else " .  .", color=FG_RED)
-    else:
-        if luck > 0.4:
-            player.score += 6
-            player.inventory.append("Toolkit")
-            type_text("You stole useful gear. +6 pts" if player.lang=="en" else "  . +6 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("Caught by scavengers. -1 HP" if player.lang=="en" else "  .  .", color=FG_RED)
+        return 0.25 if choice == "2" else 0.1
 
-    summary(player)
-
-# Level 4: Forest
 
-def level_forest(player):
-    player.stage = max(player.stage, 4)
-    clear()
-    loading_bar("Moving through a dense forest..." if player.lang=="en" else "   ...", color=FG_GREEN)
-    if player.lang == "ar":
-        type_text("\n:    ...")
-        type_text("1)   ")
-        type_text("2)   ")
-        type_text("3)   ")
-        choice = ask_int(" 1-3: ", valid={1,2,3}, lang="ar")
+def boss_thresh(char, choice):
+    """Final score needed for the victory ending of a boss option."""
+    if choice == "1":
+        return 45 if char in ("Warrior","") else 60
+    elif choice == "2":
+        return 48 if char in ("Trickster","","Scholar","") else 62
     else:
-        type_text("\nScene: Trees and unknown noises...")
-        type_text("1) Follow the sound of water")
-        type_text("2) Avoid the noise")
-        type_text("3) Set traps for animals")
-        choice = ask_int("Choose 1-3: ", valid={1,2,3}, lang="en")
-
-    luck = random.random()
-    if "Oasis Water" in player.inventory:
-        luck += 0.07
-
-    if choice == 1:
-        if luck > 0.5:
-            player.score += 9
-            player.inventory.append("Fresh Water")
-            type_text("Found a stream. +9 pts" if player.lang=="en" else "  . +9 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("Ambushed by bandits. -1 HP" if player.lang=="en" else "!  .", color=FG_RED)
-    elif choice == 2:
-        player.score += 3
-        type_text("You avoided conflict. +3 pts" if player.lang=="en" else " . +3 ", color=FG_YELLOW)
-    else:
-        if luck > 0.55:
-            player.score += 11
-            player.inventory.append("Game Meat")
-            type_text("Trap successful. +11 pts" if player.lang=="en" else " . +11 ", color=FG_GREEN)
-        else:
-            player.hp -= 1
-            type_text("Trap failed. -1 HP" if player.lang=="en" else " .  .", color=FG_RED)
+        return 75
 
-    summary(player)
-
-# Final Boss Stage
 
 def boss_final(player):
+    M = MSGS[player.lang]
     player.stage = max(player.stage, 5)
     clear()
-    loading_bar("Approaching the stronghold..." if player.lang=="en" else "   ...", color=FG_MAGENTA)
-    if player.lang == "ar":
-        type_text("\n :      .")
-        type_text("1)  ")
-        type_text("2) /")
-        type_text("3)  ")
-        choice = ask_int(" 1-3: ", valid={1,2,3}, lang="ar")
-    else:
-        type_text("\nFinal Scene: The gang controls the water supply.")
-        type_text("1) Direct assault")
-        type_text("2) Negotiate/deceive")
-        type_text("3) Make a deal/ally")
-        choice = ask_int("Choose 1-3: ", valid={1,2,3}, lang="en")
+    loading_bar(M["boss_loader"], style="magenta")
+    choice = scene_choice(player, "boss")
 
     base_roll = random.random()
-    char_mod = 0.0
-    if player.char in ("Warrior", ""):
-        char_mod = 0.25 if choice == 1 else 0.05
-    elif player.char in ("Scholar", ""):
-        char_mod = 0.25 if choice == 2 else 0.05
-    else:
-        char_mod = 0.25 if choice == 2 else 0.1
+    char_mod = boss_char_mod(player.char, choice)
 
     inventory_bonus = 0.0
     if "Vaccine Sample" in player.inventory:
@@ -419,23 +706,21 @@ def boss_final(player):
 
     final_score = player.score + (base_roll + char_mod + inventory_bonus) * 35
 
-    if choice == 1:
-        type_text("\nExecuting assault..." if player.lang=="en" else " ...")
-        thresh = 45 if player.char in ("Warrior","") else 60
-        if final_score >= thresh:
+    if choice == "1":
+        type_text(M["boss_act1"])
+        if final_score >= boss_thresh(player.char, choice):
             return "victory_force", final_score
         else:
             return "defeat_force", final_score
-    elif choice == 2:
-        type_text("\nAttempting negotiation..." if player.lang=="en" else " ...")
-        thresh = 48 if player.char in ("Trickster","","Scholar","") else 62
-        if final_score >= thresh:
+    elif choice == "2":
+        type_text(M["boss_act2"])
+        if final_score >= boss_thresh(player.char, choice):
             return "victory_cunning", final_score
         else:
             return "defeat_cunning", final_score
     else:
-        type_text("\nForming an alliance..." if player.lang=="en" else " ...")
-        if final_score >= 75:
+        type_text(M["boss_act3"])
+        if final_score >= boss_thresh(player.char, choice):
             return "victory_alliance", final_score
         elif final_score >= 45:
             return "compromise", final_score
@@ -445,65 +730,125 @@ def boss_final(player):
 # Summary helper
 
 def summary(player):
-    type_text("\n--- Status ---", color=FG_CYAN)
-    type_text(f"Name: {player.name} | HP: {player.hp} | Score: {player.score}", color=FG_YELLOW)
+    type_text("\n--- Status ---", style="cyan")
+    type_text(f"Name: {player.name} | HP: {player.hp} | Score: {player.score}", style="yellow")
     if player.inventory:
-        type_text("Inventory: " + ", ".join(player.inventory), color=FG_MAGENTA)
+        type_text("Inventory: " + ", ".join(sorted(player.inventory)), style="magenta")
     else:
-        type_text("Inventory: (empty)", color=FG_MAGENTA)
-    type_text("(press Enter to continue)" if player.lang=="en" else " Enter ...")
+        type_text("Inventory: (empty)", style="magenta")
+    type_text(MSGS[player.lang]["press_enter"])
     input()
 
 # Endings
 
+ENDING_COLORS = {
+    "victory_force": "green",
+    "victory_cunning": "green",
+    "victory_alliance": "green",
+    "compromise": "yellow",
+    "betrayed": "red",
+}
+
+
 def endings(tag, final_score, player):
+    M = MSGS[player.lang]
     clear()
-    type_text(BOLD + "=== FINAL OUTCOME ===" + RESET, color=FG_CYAN)
-    if tag == "victory_force":
-        type_text("You led a victorious assault and liberated the stronghold!" if player.lang=="en" else "    !", color=FG_GREEN)
-    elif tag == "victory_cunning":
-        type_text("Through cunning you secured control and rebalanced resources." if player.lang=="en" else "       .", color=FG_GREEN)
-    elif tag == "victory_alliance":
-        type_text("A risky alliance paid off — stable resources for many." if player.lang=="en" else "      .", color=FG_GREEN)
-    elif tag == "compromise":
-        type_text("You compromised — survival with strings attached." if player.lang=="en" else "  —   .", color=FG_YELLOW)
-    elif tag == "betrayed":
-        type_text("You were betrayed. Learn and adapt." if player.lang=="en" else " .  .", color=FG_RED)
+    type_text("=== FINAL OUTCOME ===", style="title")
+    if tag in ENDING_COLORS:
+        type_text(M["end_" + tag], style=ENDING_COLORS[tag])
     else:
-        type_text("Defeat — you survived barely or perished." if player.lang=="en" else " —     .", color=FG_RED)
+        type_text(M["end_defeat"], style="red")
 
-    type_text(f"Final Score: {int(final_score)} | HP: {player.hp}", color=FG_CYAN)
-    type_text("Do you want to save this run to results file? (y/n)" if player.lang=="en" else "    (y/n)", color=FG_YELLOW)
-    ans = input().strip().lower()
-    if ans.startswith("y"):
+    type_text(f"Final Score: {int(final_score)} | HP: {player.hp}", style="cyan")
+    if _prompt_yn(paint("yellow", M["results_prompt"])):
         append_result(player, tag, final_score)
-        type_text("Saved to file." if player.lang=="en" else " .", color=FG_GREEN)
+        type_text(M["results_saved"], style="green")
+
+# ----------------- Balance Testing -----------------
+
+def simulate(n_sims, char, choices=None, seed=None):
+    """Monte-Carlo playthroughs for balance testing (requires NumPy).
+
+    Plays `n_sims` runs of `char` picking `choices` (one per stage, boss last;
+    defaults to option 1 everywhere) with all rolls drawn up front and every
+    stage resolved as array operations.
+    Returns the fraction of runs per ending tag ("dead" = lost all HP before
+    the boss) and the mean final score of runs that reached the boss.
+    """
+    import numpy as np
+
+    if choices is None:
+        choices = ("1",) * (len(LEVELS) + 1)
+    rng = np.random.default_rng(seed)
+    rolls = rng.random((n_sims, len(LEVELS) + 1))
+    hp = np.full(n_sims, 3)
+    score = np.zeros(n_sims)
+    alive = np.ones(n_sims, dtype=bool)
+    none = np.zeros(n_sims, dtype=bool)
+    items = {}
+    probe = Player("sim", char=char)  # empty inventory: luck_bonus gives the char part only
+
+    for col, spec in enumerate(LEVELS):
+        opt = spec["choices"][int(choices[col]) - 1]
+        if opt["thresh"] is None:
+            win = alive.copy()
+        else:
+            luck = rolls[:, col] + luck_bonus(probe, spec)
+            if "item_bonus" in spec:
+                item, value = spec["item_bonus"]
+                luck += np.where(items.get(item, none), value, 0.0)
+            win = alive & ((luck > opt["thresh"]) | (char in opt.get("auto_win", ())))
+            hp -= alive & ~win
+            items[opt["item"]] = items.get(opt["item"], none) | win
+        score += np.where(win, opt["score"], 0)
+        alive &= hp > 0
+
+    boss_choice = choices[len(LEVELS)]
+    bonus = (np.where(items.get("Vaccine Sample", none), 0.2, 0.0)
+             + np.where(items.get("Game Meat", none) | items.get("Canned Food", none), 0.05, 0.0)
+             + np.where(items.get("Energy Cell", none), 0.08, 0.0))
+    final = score + (rolls[:, -1] + boss_char_mod(char, boss_choice) + bonus) * 35
+    won = final >= boss_thresh(char, boss_choice)
+    if boss_choice == "1":
+        tags = np.where(won, "victory_force", "defeat_force")
+    elif boss_choice == "2":
+        tags = np.where(won, "victory_cunning", "defeat_cunning")
+    else:
+        tags = np.where(won, "victory_alliance", np.where(final >= 45, "compromise", "betrayed"))
+    tags = np.where(alive, tags, "dead")
+
+    names, counts = np.unique(tags, return_counts=True)
+    result = {str(name): float(count / n_sims) for name, count in zip(names, counts)}
+    result["mean_score"] = float(final[alive].mean()) if alive.any() else 0.0
+    return result
+
 
 # ----------------- Game Flow -----------------
 
 def main():
     clear()
-    type_text(BOLD + "Survive or Die — Story (EN/AR)" + RESET, color=FG_CYAN)
+    type_text("Survive or Die — Story (EN/AR)", style="title")
     type_text("1) English\n2) ")
-    lang_choice = ask_int("Choose language 1-2: ", valid={1,2}, lang="en")
-    lang = "en" if lang_choice == 1 else "ar"
+    lang_choice = ask_choice("Choose language 1-2: ", {"1", "2"}, lang="en")
+    lang = "en" if lang_choice == "1" else "ar"
+    M = MSGS[lang]
+    save_exists = os.path.exists(SAVE_FILENAME) or os.path.exists(LEGACY_SAVE_FILENAME)
 
     # Offer to load checkpoint
     loaded = None
-    if os.path.exists(SAVE_FILENAME):
-        type_text("Load previous checkpoint? (y/n)" if lang=="en" else "     (y/n)")
-        if input().strip().lower().startswith("y"):
+    if save_exists:
+        if _prompt_yn(M["load_prompt"]):
             loaded = load_checkpoint()
             if loaded:
-                type_text((f"Loaded checkpoint for {loaded.name}." if lang=="en" else f"   {loaded.name}.") , color=FG_GREEN)
+                type_text(M["loaded"].format(name=loaded.name), style="green")
             else:
-                type_text(("Failed to load checkpoint." if lang=="en" else "  ."), color=FG_YELLOW)
+                type_text(M["load_failed"], style="yellow")
 
     if loaded:
         player = loaded
         player.lang = lang
     else:
-        name = input("Enter player name: " if lang=="en" else "  : ").strip() or ("Player" if lang=="en" else "")
+        name = input(M["name_prompt"]).strip() or M["default_name"]
         player = Player(name, lang=lang)
 
     # Intro / character selection if new
@@ -511,42 +856,61 @@ def main():
         intro(player)
 
     # Main sequence with save checkpoints between levels
-    levels = [level_town, level_desert, level_lab, level_forest, boss_final]
+    levels = [functools.partial(run_level, spec=spec) for spec in LEVELS] + [boss_final]
     for idx, level_func in enumerate(levels, start=1):
+        M = MSGS[player.lang]
         # Allow quick-save before starting each level
-        type_text(("Do you want to save a checkpoint now? (y/n)" if player.lang=="en" else "     (y/n)"), color=FG_YELLOW)
-        if input().strip().lower().startswith("y"):
+        if _prompt_yn(paint("yellow", M["save_prompt"])):
             if save_checkpoint(player):
-                type_text(("Checkpoint saved." if player.lang=="en" else "  ."), color=FG_GREEN)
+                print(paint("green", M["saved"]))
             else:
-                type_text(("Failed to save." if player.lang=="en" else " ."), color=FG_RED)
+                print(paint("red", M["save_failed"]))
 
         level_func(player)
 
         if player.hp <= 0:
-            type_text(("You have lost all HP. Game Over." if player.lang=="en" else " .  ."), color=FG_RED)
+            type_text(M["game_over"], style="red")
             # Offer reload
-            type_text(("Load checkpoint and retry? (y/n)" if player.lang=="en" else "     (y/n)"), color=FG_YELLOW)
-            if input().strip().lower().startswith("y"):
+            if _prompt_yn(paint("yellow", M["retry_prompt"])):
                 loaded = load_checkpoint()
                 if loaded:
                     player = loaded
-                    type_text(("Checkpoint loaded. Resuming..." if player.lang=="en" else "  .  ..."), color=FG_GREEN)
+                    type_text(MSGS[player.lang]["resumed"], style="green")
                     continue
                 else:
-                    type_text(("No checkpoint available. Exiting." if player.lang=="en" else "   . ."), color=FG_RED)
+                    type_text(M["no_checkpoint"], style="red")
             return
 
     tag, final_score = boss_final(player)
     endings(tag, final_score, player)
 
-    # Remove checkpoint on successful end
-    if os.path.exists(SAVE_FILENAME):
+    # Remove checkpoint (and any legacy one) on successful end
+    for filename in (SAVE_FILENAME, LEGACY_SAVE_FILENAME):
         try:
-            os.remove(SAVE_FILENAME)
-        except Exception:
+            os.remove(filename)
+        except OSError:
             pass
 
 
+def simulate_cli(args):
+    """python Survive-Die.py --simulate N CHAR [CHOICES], e.g. --simulate 100000 Warrior 33331"""
+    stages = len(LEVELS) + 1
+    usage = (f"usage: {sys.argv[0]} --simulate N CHAR [CHOICES]\n"
+             f"  N: number of runs (> 0); CHAR: {'|'.join(CHARS['en'])}; "
+             f"CHOICES: {stages} digits 1-3, one per stage")
+    if len(args) not in (2, 3) or not args[0].isdigit() or int(args[0]) == 0:
+        sys.exit(usage)
+    if args[1] not in CHARS["en"]:
+        sys.exit(usage)
+    choices = tuple(args[2]) if len(args) == 3 else None
+    if choices is not None and (len(choices) != stages or any(c not in ("1", "2", "3") for c in choices)):
+        sys.exit(usage)
+    for key, value in simulate(int(args[0]), args[1], choices).items():
+        print(f"{key}: {value:.4f}")
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--simulate" in sys.argv:
+        simulate_cli(sys.argv[sys.argv.index("--simulate") + 1:])
+    else:
+        main()